@@ -179,9 +179,16 @@ test_service() {
     
     print_status "Testing deployed service..."
     
-    # Wait a bit for the service to fully start
-    sleep 30
-    
+    # Poll the health endpoint with backoff (1s doubling to 8s, 60s ceiling)
+    # instead of always waiting a fixed 30s
+    local delay=1
+    local waited=0
+    until curl -fs "${service_url}/health" > /dev/null 2>&1 || [ "${waited}" -ge 60 ]; do
+        sleep "${delay}"
+        waited=$((waited + delay))
+        delay=$((delay * 2 > 8 ? 8 : delay * 2))
+    done
+
     # Test health endpoint
     if curl -f "${service_url}/health" > /dev/null 2>&1; then
         print_success "Health check passed"
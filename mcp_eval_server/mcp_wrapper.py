@@ -10,11 +10,14 @@ the MCP protocol via Server-Sent Events (SSE).
 # Standard
 import argparse
 import asyncio
-import json
+from functools import lru_cache
+from hashlib import blake2b
 import logging
 import os
+import socket
 import sys
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
 # Load .env file if it exists
 try:
@@ -26,8 +29,10 @@ except ImportError:
     pass
 
 # Third-Party
+from cachetools import LRUCache
 import httpx
 from fastmcp import FastMCP
+import orjson
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
@@ -39,48 +44,162 @@ mcp = FastMCP("mcp-eval-wrapper")
 # Configuration
 REST_API_BASE_URL = os.getenv("REST_API_BASE_URL", "http://localhost:8080")
 REST_API_TIMEOUT = 30.0
+# Judge models whose output is a pure function of the request, safe to memoize
+DETERMINISTIC_JUDGE_MODELS = frozenset(m.strip() for m in os.getenv("MCP_EVAL_DETERMINISTIC_JUDGES", "rule-based").split(",") if m.strip())
+# Request fields naming a model that produces the result
+MODEL_FIELDS = ("judge_model", "fact_checking_model")
+# Maximum number of memoized deterministic responses
+RESPONSE_CACHE_SIZE = 10_000
+# REST API ASGI app to call in-process (bypasses TCP when running in the same process)
+REST_API_APP: Optional[Any] = None
+# Call the evaluation tools in this process instead of going through the REST API
+LOCAL_DISPATCH = os.getenv("LOCAL_DISPATCH", "false").lower() == "true"
+
+# REST API endpoint -> (tool category, method) taking the request body as keyword arguments
+LOCAL_ROUTES: Dict[str, Tuple[str, str]] = {
+    "/judge/evaluate": ("judge", "evaluate_response"),
+    "/judge/compare": ("judge", "pairwise_comparison"),
+    "/judge/rank": ("judge", "rank_responses"),
+    "/judge/reference": ("judge", "evaluate_with_reference"),
+    "/quality/factuality": ("quality", "evaluate_factuality"),
+    "/quality/coherence": ("quality", "measure_coherence"),
+    "/quality/toxicity": ("quality", "assess_toxicity"),
+    "/prompt/clarity": ("prompt", "evaluate_clarity"),
+    "/prompt/consistency": ("prompt", "test_consistency"),
+    "/prompt/completeness": ("prompt", "measure_completeness"),
+    "/prompt/relevance": ("prompt", "assess_relevance"),
+    "/agent/tool-use": ("agent", "evaluate_tool_use"),
+    "/agent/task-completion": ("agent", "measure_task_completion"),
+    "/agent/reasoning": ("agent", "analyze_reasoning"),
+    "/agent/benchmark": ("agent", "benchmark_performance"),
+    "/rag/retrieval-relevance": ("rag", "evaluate_retrieval_relevance"),
+    "/rag/context-utilization": ("rag", "measure_context_utilization"),
+    "/rag/answer-groundedness": ("rag", "assess_answer_groundedness"),
+    "/rag/hallucination-detection": ("rag", "detect_hallucination_vs_context"),
+}
+
+
+def _content_key(endpoint: str, data: Dict[str, Any]) -> str:
+    """Hash an endpoint and request body into a stable cache key.
+
+    Args:
+        endpoint: REST API endpoint path.
+        data: Request body.
+
+    Returns:
+        str: Hex digest that is independent of dict key order.
+    """
+    digest = blake2b(endpoint.encode(), digest_size=16)
+    digest.update(orjson.dumps(data, option=orjson.OPT_SORT_KEYS))
+    return digest.hexdigest()
 
 
 class RESTAPIClient:
-    """Client for making requests to the REST API."""
-    
-    def __init__(self, base_url: str = REST_API_BASE_URL, timeout: float = REST_API_TIMEOUT):
-        self.base_url = base_url.rstrip('/')
-        self.timeout = timeout
-        self.client = httpx.AsyncClient(timeout=timeout)
-    
-    async def __aenter__(self):
+    """Client for making requests to the REST API.
+
+    A single ``httpx.AsyncClient`` is created lazily on first use and reused for
+    every tool call, so keep-alive connections to the REST API are pooled instead
+    of paying a fresh TCP handshake per request. Concurrent identical POSTs are
+    coalesced onto a single upstream request.
+    """
+
+    def __init__(self, base_url: Optional[str] = None, timeout: Optional[float] = None):
+        self._base_url = base_url
+        self._timeout = timeout
+        self._client: Optional[httpx.AsyncClient] = None
+        self._inflight: Dict[str, "asyncio.Future[bytes]"] = {}
+
+    @property
+    def base_url(self) -> str:
+        """REST API base URL, resolved when the pooled client is first created."""
+        return (self._base_url or REST_API_BASE_URL).rstrip("/")
+
+    @property
+    def timeout(self) -> float:
+        """Request timeout in seconds."""
+        return self._timeout or REST_API_TIMEOUT
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared pooled HTTP client.
+
+        Created on first access rather than at import time because ``main()``
+        rewrites the global configuration after argument parsing.
+        """
+        if self._client is None:
+            if REST_API_APP is not None:
+                # Dispatch straight into the in-process ASGI app, no sockets involved
+                self._client = httpx.AsyncClient(
+                    transport=httpx.ASGITransport(app=REST_API_APP),
+                    base_url="http://rest-api",
+                    timeout=self.timeout,
+                )
+            else:
+                transport = httpx.AsyncHTTPTransport(
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                    socket_options=[(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)],
+                )
+                self._client = httpx.AsyncClient(transport=transport, base_url=self.base_url, timeout=self.timeout)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client, if one was created."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "RESTAPIClient":
         return self
-    
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.client.aclose()
-    
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.aclose()
+
     async def get(self, endpoint: str, **kwargs) -> Dict[str, Any]:
-        """Make a GET request to the REST API."""
-        url = f"{self.base_url}{endpoint}"
+        """Make a GET request to the REST API and decode the JSON response."""
+        return orjson.loads(await self.get_raw(endpoint, **kwargs))
+
+    async def get_raw(self, endpoint: str, **kwargs: Any) -> bytes:
+        """Make a GET request to the REST API and return the undecoded body."""
         try:
-            response = await self.client.get(url, **kwargs)
+            response = await self.client.get(endpoint, **kwargs)
             response.raise_for_status()
-            return response.json()
+            return response.content
         except httpx.HTTPError as e:
-            logger.error(f"HTTP error for GET {url}: {e}")
+            logger.error(f"HTTP error for GET {endpoint}: {e}")
             raise
         except Exception as e:
-            logger.error(f"Error for GET {url}: {e}")
+            logger.error(f"Error for GET {endpoint}: {e}")
             raise
-    
+
     async def post(self, endpoint: str, data: Dict[str, Any], **kwargs) -> Dict[str, Any]:
-        """Make a POST request to the REST API."""
-        url = f"{self.base_url}{endpoint}"
+        """Make a POST request to the REST API and decode the JSON response."""
+        return orjson.loads(await self.post_raw(endpoint, data, **kwargs))
+
+    async def post_raw(self, endpoint: str, data: Dict[str, Any], **kwargs: Any) -> bytes:
+        """Make a POST request to the REST API and return the undecoded body.
+
+        If an identical request (same endpoint and body) is already in flight,
+        its result is shared instead of issuing a duplicate upstream call.
+        """
+        key = _content_key(endpoint, data)
+        pending = self._inflight.get(key)
+        if pending is None:
+            pending = self._inflight[key] = asyncio.ensure_future(self._post(endpoint, data, **kwargs))
+            pending.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one cancelled caller does not cancel the request for the others
+        return await asyncio.shield(pending)
+
+    async def _post(self, endpoint: str, data: Dict[str, Any], **kwargs: Any) -> bytes:
+        """Send a single POST request to the REST API and return the raw body."""
         try:
-            response = await self.client.post(url, json=data, **kwargs)
+            response = await self.client.post(endpoint, json=data, **kwargs)
             response.raise_for_status()
-            return response.json()
+            return response.content
         except httpx.HTTPError as e:
-            logger.error(f"HTTP error for POST {url}: {e}")
+            logger.error(f"HTTP error for POST {endpoint}: {e}")
             raise
         except Exception as e:
-            logger.error(f"Error for POST {url}: {e}")
+            logger.error(f"Error for POST {endpoint}: {e}")
             raise
 
 
@@ -88,36 +207,192 @@ class RESTAPIClient:
 rest_client = RESTAPIClient()
 
 
+def _build_body(**fields: Any) -> Dict[str, Any]:
+    """Build a REST API request body, leaving out fields that were not given.
+
+    Every optional request field defaults to ``None`` on the REST API side,
+    so omitting it keeps the body smaller without changing its meaning.
+
+    Args:
+        **fields: Request fields.
+
+    Returns:
+        Dict[str, Any]: Request body without ``None`` values.
+    """
+    return {key: value for key, value in fields.items() if value is not None}
+
+
+def _encode(result: Any) -> str:
+    """Format a locally built result as JSON text, matching the REST API's compact output.
+
+    Args:
+        result: Result to encode; may contain numpy values from the tools.
+
+    Returns:
+        str: Compact JSON, encoded with orjson's C serializer.
+    """
+    return orjson.dumps(result, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
+def _local_tools() -> Optional[Dict[str, Any]]:
+    """Get the evaluation tools for in-process dispatch.
+
+    When the REST API app runs in this process (``REST_API_APP`` is set), the
+    tool instances it created at startup are shared rather than built again.
+
+    Returns:
+        Optional[Dict[str, Any]]: Tool instances by category, or None if they
+        are not available and calls should go through the REST API.
+    """
+    if REST_API_APP is not None:
+        # Local
+        from . import rest_server  # pylint: disable=import-outside-toplevel
+
+        return rest_server.tools or None
+    return _standalone_tools()
+
+
+@lru_cache(maxsize=1)
+def _standalone_tools() -> Optional[Dict[str, Any]]:
+    """Load the evaluation tools for a standalone wrapper, once.
+
+    Returns:
+        Optional[Dict[str, Any]]: Tool instances by category, or None if they
+        could not be loaded and calls should go through the REST API.
+    """
+    try:
+        # Local
+        from .tools.agent_tools import AgentTools
+        from .tools.judge_tools import JudgeTools
+        from .tools.prompt_tools import PromptTools
+        from .tools.quality_tools import QualityTools
+        from .tools.rag_tools import RAGTools
+
+        judge_tools = JudgeTools(config_path=os.getenv("MCP_EVAL_MODELS_CONFIG"))
+        tools = {
+            "judge": judge_tools,
+            "prompt": PromptTools(judge_tools),
+            "agent": AgentTools(judge_tools),
+            "quality": QualityTools(judge_tools),
+            "rag": RAGTools(judge_tools),
+        }
+    except Exception as e:
+        logger.warning(f"⚠️  Local dispatch unavailable, using the REST API: {e}")
+        return None
+
+    logger.info("⚡ Local dispatch enabled: evaluation tools run in-process")
+    return tools
+
+
+async def call_endpoint(endpoint: str, data: Dict[str, Any]) -> str:
+    """Run a REST API endpoint and return its JSON response body.
+
+    With ``LOCAL_DISPATCH`` enabled the tool method behind the endpoint is
+    awaited directly, skipping the HTTP request and its body validation.
+
+    Args:
+        endpoint: REST API endpoint path.
+        data: Request body.
+
+    Returns:
+        str: JSON-formatted response body.
+    """
+    route = LOCAL_ROUTES.get(endpoint) if LOCAL_DISPATCH else None
+    tools = _local_tools() if route is not None else None
+    if route is not None and tools is not None:
+        category, method = route
+        return _encode(await getattr(tools[category], method)(**data))
+    return (await rest_client.post_raw(endpoint, data)).decode()
+
+
+# Encoded deterministic responses keyed on a content hash of endpoint + request body
+_response_cache: LRUCache = LRUCache(maxsize=RESPONSE_CACHE_SIZE)
+
+
+async def cached_post(endpoint: str, data: Dict[str, Any], cache: bool = True) -> str:
+    """POST to the REST API, memoizing responses of deterministic judges.
+
+    Only requests whose models are all in ``DETERMINISTIC_JUDGE_MODELS`` are
+    cached, since LLM judges sample with a non-zero temperature.
+
+    Args:
+        endpoint: REST API endpoint path.
+        data: Request body.
+        cache: Whether the response may be served from or stored in the cache.
+
+    Returns:
+        str: JSON-formatted response body.
+    """
+    if not cache or not all(data[field] in DETERMINISTIC_JUDGE_MODELS for field in MODEL_FIELDS if field in data):
+        return await call_endpoint(endpoint, data)
+
+    key = _content_key(endpoint, data)
+    payload: Optional[str] = _response_cache.get(key)
+    if payload is None:
+        payload = _response_cache[key] = await call_endpoint(endpoint, data)
+    return payload
+
+
+# Formatted GET responses keyed on endpoint: (expiry, payload), plus in-flight fetches
+_get_cache: Dict[str, Tuple[float, str]] = {}
+_get_inflight: Dict[str, "asyncio.Future[str]"] = {}
+
+
+async def cached_get(endpoint: str, ttl: float) -> str:
+    """GET an idempotent endpoint and cache the JSON body for ``ttl`` seconds.
+
+    Concurrent misses for the same endpoint share a single upstream request.
+
+    Args:
+        endpoint: REST API endpoint path.
+        ttl: Time to live of the cached payload in seconds.
+
+    Returns:
+        str: JSON-formatted response body.
+    """
+    cached = _get_cache.get(endpoint)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
+    pending = _get_inflight.get(endpoint)
+    if pending is None:
+
+        async def fetch() -> str:
+            try:
+                payload = (await rest_client.get_raw(endpoint)).decode()
+                _get_cache[endpoint] = (time.monotonic() + ttl, payload)
+                return payload
+            finally:
+                _get_inflight.pop(endpoint, None)
+
+        pending = _get_inflight[endpoint] = asyncio.ensure_future(fetch())
+
+    # Shield so one cancelled caller does not cancel the fetch for the others
+    return await asyncio.shield(pending)
+
+
 @mcp.tool()
 async def get_server_info() -> str:
     """Get server information and status."""
-    async with RESTAPIClient(REST_API_BASE_URL) as client:
-        result = await client.get("/")
-        return json.dumps(result, indent=2)
+    return await cached_get("/", ttl=300.0)
 
 
 @mcp.tool()
 async def get_health_status() -> str:
     """Get health check status."""
-    async with RESTAPIClient(REST_API_BASE_URL) as client:
-        result = await client.get("/health")
-        return json.dumps(result, indent=2)
+    return await cached_get("/health", ttl=30.0)
 
 
 @mcp.tool()
 async def get_tool_categories() -> str:
     """Get list of available tool categories."""
-    async with RESTAPIClient(REST_API_BASE_URL) as client:
-        result = await client.get("/tools/categories")
-        return json.dumps(result, indent=2)
+    return await cached_get("/tools/categories", ttl=300.0)
 
 
 @mcp.tool()
 async def get_all_tools() -> str:
     """Get detailed information about all available tools."""
-    async with RESTAPIClient(REST_API_BASE_URL) as client:
-        result = await client.get("/tools")
-        return json.dumps(result, indent=2)
+    return await cached_get("/tools", ttl=300.0)
 
 
 # Judge evaluation tools
@@ -131,17 +406,15 @@ async def judge_evaluate(
     use_cot: bool = True
 ) -> str:
     """Evaluate a single response using LLM-as-a-judge."""
-    async with RESTAPIClient(REST_API_BASE_URL) as client:
-        data = {
-            "response": response,
-            "criteria": criteria,
-            "rubric": rubric,
-            "judge_model": judge_model,
-            "context": context,
-            "use_cot": use_cot
-        }
-        result = await client.post("/judge/evaluate", data)
-        return json.dumps(result, indent=2)
+    data = _build_body(
+        response=response,
+        criteria=criteria,
+        rubric=rubric,
+        judge_model=judge_model,
+        context=context,
+        use_cot=use_cot
+    )
+    return await call_endpoint("/judge/evaluate", data)
 
 
 @mcp.tool()
@@ -154,17 +427,15 @@ async def judge_compare(
     position_bias_mitigation: bool = True
 ) -> str:
     """Compare two responses using LLM-as-a-judge."""
-    async with RESTAPIClient(REST_API_BASE_URL) as client:
-        data = {
-            "response_a": response_a,
-            "response_b": response_b,
-            "criteria": criteria,
-            "judge_model": judge_model,
-            "context": context,
-            "position_bias_mitigation": position_bias_mitigation
-        }
-        result = await client.post("/judge/compare", data)
-        return json.dumps(result, indent=2)
+    data = _build_body(
+        response_a=response_a,
+        response_b=response_b,
+        criteria=criteria,
+        judge_model=judge_model,
+        context=context,
+        position_bias_mitigation=position_bias_mitigation
+    )
+    return await call_endpoint("/judge/compare", data)
 
 
 @mcp.tool()
@@ -176,16 +447,14 @@ async def judge_rank(
     ranking_method: str = "tournament"
 ) -> str:
     """Rank multiple responses using LLM-as-a-judge."""
-    async with RESTAPIClient(REST_API_BASE_URL) as client:
-        data = {
-            "responses": responses,
-            "criteria": criteria,
-            "judge_model": judge_model,
-            "context": context,
-            "ranking_method": ranking_method
-        }
-        result = await client.post("/judge/rank", data)
-        return json.dumps(result, indent=2)
+    data = _build_body(
+        responses=responses,
+        criteria=criteria,
+        judge_model=judge_model,
+        context=context,
+        ranking_method=ranking_method
+    )
+    return await call_endpoint("/judge/rank", data)
 
 
 @mcp.tool()
@@ -194,19 +463,18 @@ async def judge_reference(
     reference: str,
     judge_model: str = "gpt-4o-mini",
     evaluation_type: str = "factuality",
-    tolerance: str = "moderate"
+    tolerance: str = "moderate",
+    cache: bool = True
 ) -> str:
     """Evaluate response against gold standard reference."""
-    async with RESTAPIClient(REST_API_BASE_URL) as client:
-        data = {
-            "response": response,
-            "reference": reference,
-            "judge_model": judge_model,
-            "evaluation_type": evaluation_type,
-            "tolerance": tolerance
-        }
-        result = await client.post("/judge/reference", data)
-        return json.dumps(result, indent=2)
+    data = _build_body(
+        response=response,
+        reference=reference,
+        judge_model=judge_model,
+        evaluation_type=evaluation_type,
+        tolerance=tolerance
+    )
+    return await cached_post("/judge/reference", data, cache=cache)
 
 
 # Quality assessment tools
@@ -216,19 +484,18 @@ async def quality_factuality(
     knowledge_base: Optional[Dict[str, Any]] = None,
     fact_checking_model: str = "gpt-4",
     confidence_threshold: float = 0.8,
-    judge_model: str = "gpt-4o-mini"
+    judge_model: str = "gpt-4o-mini",
+    cache: bool = True
 ) -> str:
     """Check factual accuracy of responses."""
-    async with RESTAPIClient(REST_API_BASE_URL) as client:
-        data = {
-            "response": response,
-            "knowledge_base": knowledge_base,
-            "fact_checking_model": fact_checking_model,
-            "confidence_threshold": confidence_threshold,
-            "judge_model": judge_model
-        }
-        result = await client.post("/quality/factuality", data)
-        return json.dumps(result, indent=2)
+    data = _build_body(
+        response=response,
+        knowledge_base=knowledge_base,
+        fact_checking_model=fact_checking_model,
+        confidence_threshold=confidence_threshold,
+        judge_model=judge_model
+    )
+    return await cached_post("/quality/factuality", data, cache=cache)
 
 
 @mcp.tool()
@@ -242,15 +509,13 @@ async def quality_coherence(
     if coherence_dimensions is None:
         coherence_dimensions = ["logical_flow", "consistency", "topic_transitions"]
     
-    async with RESTAPIClient(REST_API_BASE_URL) as client:
-        data = {
-            "text": text,
-            "context": context,
-            "coherence_dimensions": coherence_dimensions,
-            "judge_model": judge_model
-        }
-        result = await client.post("/quality/coherence", data)
-        return json.dumps(result, indent=2)
+    data = _build_body(
+        text=text,
+        context=context,
+        coherence_dimensions=coherence_dimensions,
+        judge_model=judge_model
+    )
+    return await call_endpoint("/quality/coherence", data)
 
 
 @mcp.tool()
@@ -264,15 +529,13 @@ async def quality_toxicity(
     if toxicity_categories is None:
         toxicity_categories = ["profanity", "hate_speech", "threats", "discrimination"]
     
-    async with RESTAPIClient(REST_API_BASE_URL) as client:
-        data = {
-            "content": content,
-            "toxicity_categories": toxicity_categories,
-            "sensitivity_level": sensitivity_level,
-            "judge_model": judge_model
-        }
-        result = await client.post("/quality/toxicity", data)
-        return json.dumps(result, indent=2)
+    data = _build_body(
+        content=content,
+        toxicity_categories=toxicity_categories,
+        sensitivity_level=sensitivity_level,
+        judge_model=judge_model
+    )
+    return await call_endpoint("/quality/toxicity", data)
 
 
 # Prompt evaluation tools
@@ -284,15 +547,13 @@ async def prompt_clarity(
     judge_model: str = "gpt-4o-mini"
 ) -> str:
     """Assess prompt clarity."""
-    async with RESTAPIClient(REST_API_BASE_URL) as client:
-        data = {
-            "prompt_text": prompt_text,
-            "target_model": target_model,
-            "domain_context": domain_context,
-            "judge_model": judge_model
-        }
-        result = await client.post("/prompt/clarity", data)
-        return json.dumps(result, indent=2)
+    data = _build_body(
+        prompt_text=prompt_text,
+        target_model=target_model,
+        domain_context=domain_context,
+        judge_model=judge_model
+    )
+    return await call_endpoint("/prompt/clarity", data)
 
 
 @mcp.tool()
@@ -307,16 +568,14 @@ async def prompt_consistency(
     if temperature_range is None:
         temperature_range = [0.1, 0.5, 0.9]
     
-    async with RESTAPIClient(REST_API_BASE_URL) as client:
-        data = {
-            "prompt": prompt,
-            "test_inputs": test_inputs,
-            "num_runs": num_runs,
-            "temperature_range": temperature_range,
-            "judge_model": judge_model
-        }
-        result = await client.post("/prompt/consistency", data)
-        return json.dumps(result, indent=2)
+    data = _build_body(
+        prompt=prompt,
+        test_inputs=test_inputs,
+        num_runs=num_runs,
+        temperature_range=temperature_range,
+        judge_model=judge_model
+    )
+    return await call_endpoint("/prompt/consistency", data)
 
 
 @mcp.tool()
@@ -327,15 +586,13 @@ async def prompt_completeness(
     judge_model: str = "gpt-4o-mini"
 ) -> str:
     """Measure prompt completeness."""
-    async with RESTAPIClient(REST_API_BASE_URL) as client:
-        data = {
-            "prompt": prompt,
-            "expected_components": expected_components,
-            "test_samples": test_samples,
-            "judge_model": judge_model
-        }
-        result = await client.post("/prompt/completeness", data)
-        return json.dumps(result, indent=2)
+    data = _build_body(
+        prompt=prompt,
+        expected_components=expected_components,
+        test_samples=test_samples,
+        judge_model=judge_model
+    )
+    return await call_endpoint("/prompt/completeness", data)
 
 
 @mcp.tool()
@@ -347,16 +604,14 @@ async def prompt_relevance(
     judge_model: str = "gpt-4o-mini"
 ) -> str:
     """Assess prompt relevance."""
-    async with RESTAPIClient(REST_API_BASE_URL) as client:
-        data = {
-            "prompt": prompt,
-            "outputs": outputs,
-            "embedding_model": embedding_model,
-            "relevance_threshold": relevance_threshold,
-            "judge_model": judge_model
-        }
-        result = await client.post("/prompt/relevance", data)
-        return json.dumps(result, indent=2)
+    data = _build_body(
+        prompt=prompt,
+        outputs=outputs,
+        embedding_model=embedding_model,
+        relevance_threshold=relevance_threshold,
+        judge_model=judge_model
+    )
+    return await call_endpoint("/prompt/relevance", data)
 
 
 # Agent evaluation tools
@@ -369,16 +624,14 @@ async def agent_tool_use(
     judge_model: str = "gpt-4o-mini"
 ) -> str:
     """Evaluate agent tool usage."""
-    async with RESTAPIClient(REST_API_BASE_URL) as client:
-        data = {
-            "agent_trace": agent_trace,
-            "expected_tools": expected_tools,
-            "tool_sequence_matters": tool_sequence_matters,
-            "allow_extra_tools": allow_extra_tools,
-            "judge_model": judge_model
-        }
-        result = await client.post("/agent/tool-use", data)
-        return json.dumps(result, indent=2)
+    data = _build_body(
+        agent_trace=agent_trace,
+        expected_tools=expected_tools,
+        tool_sequence_matters=tool_sequence_matters,
+        allow_extra_tools=allow_extra_tools,
+        judge_model=judge_model
+    )
+    return await call_endpoint("/agent/tool-use", data)
 
 
 @mcp.tool()
@@ -390,16 +643,14 @@ async def agent_task_completion(
     judge_model: str = "gpt-4o-mini"
 ) -> str:
     """Evaluate agent task completion."""
-    async with RESTAPIClient(REST_API_BASE_URL) as client:
-        data = {
-            "task_description": task_description,
-            "success_criteria": success_criteria,
-            "agent_trace": agent_trace,
-            "final_state": final_state,
-            "judge_model": judge_model
-        }
-        result = await client.post("/agent/task-completion", data)
-        return json.dumps(result, indent=2)
+    data = _build_body(
+        task_description=task_description,
+        success_criteria=success_criteria,
+        agent_trace=agent_trace,
+        final_state=final_state,
+        judge_model=judge_model
+    )
+    return await call_endpoint("/agent/task-completion", data)
 
 
 @mcp.tool()
@@ -411,16 +662,14 @@ async def agent_reasoning(
     judge_model: str = "gpt-4o-mini"
 ) -> str:
     """Analyze agent reasoning quality."""
-    async with RESTAPIClient(REST_API_BASE_URL) as client:
-        data = {
-            "reasoning_trace": reasoning_trace,
-            "decision_points": decision_points,
-            "context": context,
-            "optimal_path": optimal_path,
-            "judge_model": judge_model
-        }
-        result = await client.post("/agent/reasoning", data)
-        return json.dumps(result, indent=2)
+    data = _build_body(
+        reasoning_trace=reasoning_trace,
+        decision_points=decision_points,
+        context=context,
+        optimal_path=optimal_path,
+        judge_model=judge_model
+    )
+    return await call_endpoint("/agent/reasoning", data)
 
 
 @mcp.tool()
@@ -434,15 +683,13 @@ async def agent_benchmark(
     if metrics_focus is None:
         metrics_focus = ["accuracy", "efficiency", "reliability"]
     
-    async with RESTAPIClient(REST_API_BASE_URL) as client:
-        data = {
-            "benchmark_suite": benchmark_suite,
-            "agent_config": agent_config,
-            "baseline_comparison": baseline_comparison,
-            "metrics_focus": metrics_focus
-        }
-        result = await client.post("/agent/benchmark", data)
-        return json.dumps(result, indent=2)
+    data = _build_body(
+        benchmark_suite=benchmark_suite,
+        agent_config=agent_config,
+        baseline_comparison=baseline_comparison,
+        metrics_focus=metrics_focus
+    )
+    return await call_endpoint("/agent/benchmark", data)
 
 
 # RAG evaluation tools
@@ -456,17 +703,15 @@ async def rag_retrieval_relevance(
     use_llm_judge: bool = True
 ) -> str:
     """Evaluate RAG retrieval relevance."""
-    async with RESTAPIClient(REST_API_BASE_URL) as client:
-        data = {
-            "query": query,
-            "retrieved_documents": retrieved_documents,
-            "relevance_threshold": relevance_threshold,
-            "embedding_model": embedding_model,
-            "judge_model": judge_model,
-            "use_llm_judge": use_llm_judge
-        }
-        result = await client.post("/rag/retrieval-relevance", data)
-        return json.dumps(result, indent=2)
+    data = _build_body(
+        query=query,
+        retrieved_documents=retrieved_documents,
+        relevance_threshold=relevance_threshold,
+        embedding_model=embedding_model,
+        judge_model=judge_model,
+        use_llm_judge=use_llm_judge
+    )
+    return await call_endpoint("/rag/retrieval-relevance", data)
 
 
 @mcp.tool()
@@ -478,16 +723,14 @@ async def rag_context_utilization(
     judge_model: str = "gpt-4o-mini"
 ) -> str:
     """Evaluate RAG context utilization."""
-    async with RESTAPIClient(REST_API_BASE_URL) as client:
-        data = {
-            "query": query,
-            "retrieved_context": retrieved_context,
-            "generated_answer": generated_answer,
-            "context_chunks": context_chunks,
-            "judge_model": judge_model
-        }
-        result = await client.post("/rag/context-utilization", data)
-        return json.dumps(result, indent=2)
+    data = _build_body(
+        query=query,
+        retrieved_context=retrieved_context,
+        generated_answer=generated_answer,
+        context_chunks=context_chunks,
+        judge_model=judge_model
+    )
+    return await call_endpoint("/rag/context-utilization", data)
 
 
 @mcp.tool()
@@ -496,19 +739,18 @@ async def rag_answer_groundedness(
     answer: str,
     supporting_context: str,
     judge_model: str = "gpt-4o-mini",
-    strictness: str = "moderate"
+    strictness: str = "moderate",
+    cache: bool = True
 ) -> str:
     """Evaluate RAG answer groundedness."""
-    async with RESTAPIClient(REST_API_BASE_URL) as client:
-        data = {
-            "question": question,
-            "answer": answer,
-            "supporting_context": supporting_context,
-            "judge_model": judge_model,
-            "strictness": strictness
-        }
-        result = await client.post("/rag/answer-groundedness", data)
-        return json.dumps(result, indent=2)
+    data = _build_body(
+        question=question,
+        answer=answer,
+        supporting_context=supporting_context,
+        judge_model=judge_model,
+        strictness=strictness
+    )
+    return await cached_post("/rag/answer-groundedness", data, cache=cache)
 
 
 @mcp.tool()
@@ -516,18 +758,34 @@ async def rag_hallucination_detection(
     generated_text: str,
     source_context: str,
     judge_model: str = "gpt-4o-mini",
-    detection_threshold: float = 0.8
+    detection_threshold: float = 0.8,
+    cache: bool = True
 ) -> str:
     """Detect hallucinations in RAG responses."""
-    async with RESTAPIClient(REST_API_BASE_URL) as client:
-        data = {
-            "generated_text": generated_text,
-            "source_context": source_context,
-            "judge_model": judge_model,
-            "detection_threshold": detection_threshold
-        }
-        result = await client.post("/rag/hallucination-detection", data)
-        return json.dumps(result, indent=2)
+    data = _build_body(
+        generated_text=generated_text,
+        source_context=source_context,
+        judge_model=judge_model,
+        detection_threshold=detection_threshold
+    )
+    return await cached_post("/rag/hallucination-detection", data, cache=cache)
+
+
+async def serve(host: str, port: int, transport: str = "streamable-http") -> None:
+    """Run the FastMCP server and close the pooled REST API client on shutdown.
+
+    Args:
+        host: Host to bind to (streamable-http only).
+        port: Port to bind to (streamable-http only).
+        transport: ``streamable-http``, or ``stdio`` for MCP clients that launch the wrapper.
+    """
+    try:
+        if transport == "stdio":
+            await mcp.run_async(transport="stdio", show_banner=False)
+        else:
+            await mcp.run_async(transport="streamable-http", host=host, port=port)
+    finally:
+        await rest_client.aclose()
 
 
 def main():
@@ -537,6 +795,7 @@ def main():
     parser.add_argument("--timeout", type=float, default=30.0, help="Request timeout in seconds")
     parser.add_argument("--host", default="localhost", help="Host to bind to")
     parser.add_argument("--port", type=int, default=9001, help="Port to bind to")
+    parser.add_argument("--transport", choices=["streamable-http", "stdio"], default="streamable-http", help="MCP transport to serve")
     
     args = parser.parse_args()
     
@@ -547,13 +806,23 @@ def main():
     
     logger.info("🚀 Starting MCP Evaluation Server Wrapper (SSE)...")
     logger.info(f"📡 Protocol: Model Context Protocol (MCP) via Server-Sent Events")
-    logger.info(f"🌐 URL: http://{args.host}:{args.port}")
+    if args.transport == "stdio":
+        logger.info("🌐 Transport: stdio")
+    else:
+        logger.info(f"🌐 URL: http://{args.host}:{args.port}")
     logger.info(f"🔗 REST API URL: {REST_API_BASE_URL}")
     logger.info(f"⏱️  Timeout: {REST_API_TIMEOUT}s")
     logger.info("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
     
-    # Run the FastMCP server with streamable-http
-    mcp.run(transport="streamable-http", host=args.host, port=args.port)
+    # Run the FastMCP server, on the libuv event loop when available
+    try:
+        # Third-Party
+        import uvloop  # pylint: disable=import-outside-toplevel
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    asyncio.run(serve(args.host, args.port, args.transport))
 
 
 if __name__ == "__main__":
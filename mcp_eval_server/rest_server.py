@@ -9,6 +9,7 @@ category and provides comprehensive API documentation.
 
 # Standard
 import argparse
+import asyncio
 import logging
 import os
 import sys
@@ -19,7 +20,7 @@ try:
     # Third-Party
     from fastapi import FastAPI, HTTPException, Request
     from fastapi.openapi.utils import get_openapi
-    from fastapi.responses import JSONResponse
+    from fastapi.responses import JSONResponse, Response
     from pydantic import BaseModel, Field
     import uvicorn
 except ImportError:
@@ -50,7 +51,7 @@ from .tools.performance_tools import PerformanceTools
 from .tools.privacy_tools import PrivacyTools
 from .tools.prompt_tools import PromptTools
 from .tools.quality_tools import QualityTools
-from .tools.rag_tools import RAGTools
+from .tools.rag_tools import load_embedding_model, RAGTools
 from .tools.robustness_tools import RobustnessTools
 from .tools.safety_tools import SafetyTools
 from .tools.workflow_tools import WorkflowTools
@@ -303,6 +304,16 @@ class RAGHallucinationDetectionRequest(BaseModel):
     detection_threshold: float = Field(default=0.8, description="Confidence threshold for hallucination detection")
 
 
+def _log_embedding_model_failure(future: "asyncio.Future[Any]") -> None:
+    """Log a failed background load of the embedding model, which would otherwise go unreported.
+
+    Args:
+        future: Future of the background load
+    """
+    if not future.cancelled() and future.exception() is not None:
+        logger.warning("⚠️  Could not load the local embedding model", exc_info=future.exception())
+
+
 # Initialize tools on startup
 @app.on_event("startup")
 async def startup_event():
@@ -346,9 +357,26 @@ async def startup_event():
     available_judges = judge_tools.get_available_judges()
     logger.info(f"⚖️  Loaded {len(available_judges)} judge models: {available_judges}")
 
+    # Load the local embedding model in the background so the first similarity request does not pay for it
+    asyncio.get_running_loop().run_in_executor(None, load_embedding_model).add_done_callback(_log_embedding_model_failure)
+
     logger.info("✅ REST API server startup complete!")
 
 
+SERVER_INFO_BODY = (
+    ServerInfo(
+        name="MCP Evaluation Server REST API",
+        version="0.1.0",
+        description="Comprehensive AI evaluation platform with 60+ specialized tools",
+        total_tools=63,
+        categories=["judge", "prompt", "agent", "quality", "rag", "bias", "robustness", "safety", "multilingual", "performance", "privacy", "workflow", "calibration"],
+        status="healthy",
+    )
+    .model_dump_json()
+    .encode()
+)
+
+
 # Root endpoint
 @app.get("/", response_model=ServerInfo, tags=["core"])
 async def get_server_info():
@@ -357,11 +385,8 @@ async def get_server_info():
     Returns:
         ServerInfo: Server information including name, version, and available categories.
     """
-    categories = ["judge", "prompt", "agent", "quality", "rag", "bias", "robustness", "safety", "multilingual", "performance", "privacy", "workflow", "calibration"]
-
-    return ServerInfo(
-        name="MCP Evaluation Server REST API", version="0.1.0", description="Comprehensive AI evaluation platform with 60+ specialized tools", total_tools=63, categories=categories, status="healthy"
-    )
+    # The body never changes, so it is serialized once and served as bytes
+    return Response(content=SERVER_INFO_BODY, media_type="application/json")
 
 
 # Health check endpoint
@@ -3,17 +3,67 @@
 
 # Standard
 from difflib import SequenceMatcher
+from hashlib import blake2b
 import re
 import statistics
+import threading
 from typing import Any, Dict, List, Optional, Tuple
 
 # Third-Party
+from cachetools import LRUCache
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 
 # Local
 from .judge_tools import JudgeTools
 
+# sentence-transformers model used for local semantic similarity
+LOCAL_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+# Maximum number of memoized text embeddings
+EMBEDDING_CACHE_SIZE = 10_000
+
+_embedding_models: Dict[str, Optional[Any]] = {}
+_embedding_models_lock = threading.Lock()
+# Text embeddings keyed on (model name, text digest), so cached documents are not kept as keys
+_embedding_cache: LRUCache = LRUCache(maxsize=EMBEDDING_CACHE_SIZE)
+
+
+def _embedding_key(model_name: str, text: str) -> Tuple[str, bytes]:
+    """Build the embedding cache key for a text.
+
+    Args:
+        model_name: Name of the embedding model.
+        text: Embedded text.
+
+    Returns:
+        Tuple[str, bytes]: Model name and a fixed-size digest of the text.
+    """
+    return model_name, blake2b(text.encode(), digest_size=16).digest()
+
+
+def load_embedding_model(model_name: str = LOCAL_EMBEDDING_MODEL) -> Optional[Any]:
+    """Load a sentence-transformers model once per process.
+
+    Safe to call from a warm-up thread while requests are being served.
+
+    Args:
+        model_name: sentence-transformers model name.
+
+    Returns:
+        Optional[Any]: The loaded model, or None if sentence-transformers is not installed.
+    """
+    if model_name not in _embedding_models:
+        with _embedding_models_lock:
+            if model_name not in _embedding_models:
+                try:
+                    # Third-Party
+                    from sentence_transformers import SentenceTransformer  # pylint: disable=import-outside-toplevel
+
+                    _embedding_models[model_name] = SentenceTransformer(model_name)
+                except ImportError:
+                    _embedding_models[model_name] = None
+    return _embedding_models[model_name]
+
 
 class RAGTools:
     """Tools for RAG (Retrieval-Augmented Generation) evaluation."""
@@ -587,21 +637,40 @@ class RAGTools:
         Returns:
             List of similarity scores
         """
-        try:
-            # Try to use sentence-transformers if available
-            # Third-Party
-            from sentence_transformers import SentenceTransformer  # pylint: disable=import-outside-toplevel
+        model_name = LOCAL_EMBEDDING_MODEL
+        model = load_embedding_model(model_name)
+        if model is None:
+            # Fall back to TF-IDF if sentence-transformers not available
+            return self._tfidf_similarity(query, documents)
 
-            model = SentenceTransformer("all-MiniLM-L6-v2")
+        query_embedding, *doc_embeddings = self._embed(model_name, model, [query] + documents)
 
-            query_embedding = model.encode([query])
-            doc_embeddings = model.encode(documents)
+        similarities = cosine_similarity([query_embedding], doc_embeddings)[0]
+        return similarities.tolist()
 
-            similarities = cosine_similarity(query_embedding, doc_embeddings)[0]
-            return similarities.tolist()
-        except ImportError:
-            # Fall back to TF-IDF if sentence-transformers not available
-            return self._tfidf_similarity(query, documents)
+    def _embed(self, model_name: str, model: Any, texts: List[str]) -> List[Any]:
+        """Embed texts, reusing memoized embeddings of texts seen before.
+
+        Args:
+            model_name: Name of the model, part of the cache key
+            model: Loaded sentence-transformers model
+            texts: Texts to embed
+
+        Returns:
+            List of embeddings in the same order as texts
+        """
+        embeddings = {}
+        for text in texts:
+            cached = _embedding_cache.get(_embedding_key(model_name, text))
+            if cached is not None:
+                embeddings[text] = cached
+
+        missing = [text for text in dict.fromkeys(texts) if text not in embeddings]
+        if missing:
+            for text, embedding in zip(missing, model.encode(missing)):
+                embeddings[text] = _embedding_cache[_embedding_key(model_name, text)] = embedding
+
+        return [embeddings[text] for text in texts]
 
     def _tfidf_similarity(self, query: str, documents: List[str]) -> List[float]:
         """Calculate similarity using TF-IDF vectors.
@@ -1,196 +1,209 @@
 #!/usr/bin/env python3
 """
-AWS App Runner Startup Script with Proxy
-Runs both REST API and MCP wrapper, with proxy routing
+AWS App Runner Startup Script
+Serves the REST API and the MCP wrapper from a single in-process app
 """
 
-import asyncio
+from contextlib import asynccontextmanager
+import functools
+import importlib.util
 import logging
+import multiprocessing
+import multiprocessing.connection
 import os
 import signal
-import subprocess
+import socket
 import sys
 import time
 from typing import Optional
 
 import uvicorn
-from fastapi import FastAPI, Request
-from fastapi.responses import Response
-import httpx
+from fastapi import FastAPI
+
+from mcp_eval_server import mcp_wrapper
+from mcp_eval_server.rest_server import app as rest_app
+from mcp_eval_server.rest_server import startup_event as rest_startup_event
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+# libuv event loop and C HTTP parser when installed (uvicorn[standard]), else pure-Python
+EVENT_LOOP = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+HTTP_PROTOCOL = "httptools" if importlib.util.find_spec("httptools") else "h11"
+
+# Seconds a worker gets to drain open connections on shutdown before they are closed,
+# and extra seconds the supervisor waits after that before SIGKILLing the worker
+GRACEFUL_SHUTDOWN_TIMEOUT = 3
+KILL_TIMEOUT = 2
+# Idle keep-alive kept above the front proxy's idle timeout (60s on most load balancers), so the
+# proxy's pooled connections are not closed under it by uvicorn's 5s default
+KEEP_ALIVE_TIMEOUT = 75
+
+
+@functools.lru_cache(maxsize=1)
+def _log_judges():
+    """Log the available judges once; loading them imports the whole judge tool chain"""
+    try:
+        from mcp_eval_server.tools.judge_tools import JudgeTools
+        judges = JudgeTools().get_available_judges()
+        logger.info(f"⚖️  Available judges: {', '.join(judges)}")
+    except Exception as e:
+        logger.warning(f"Could not load judges: {e}")
+
+
 class MCPEvaluationServer:
-    def __init__(self):
+    def __init__(self, stateless_http: Optional[bool] = None):
         self.external_port = int(os.getenv("PORT", "8080"))  # External port (App Runner)
-        self.rest_port = 8081  # Internal REST API port
-        self.mcp_port = 8082   # Internal MCP wrapper port
-        self.rest_process: Optional[subprocess.Popen] = None
-        self.mcp_process: Optional[subprocess.Popen] = None
-        self.proxy_app = FastAPI(title="MCP Evaluation Server Proxy")
-        self.setup_proxy_routes()
-        
-    def setup_proxy_routes(self):
-        """Setup proxy routes for MCP wrapper only"""
-        
-        @self.proxy_app.get("/")
-        async def root():
-            return {
-                "service": "MCP Evaluation Server",
-                "version": "0.1.0",
-                "endpoints": {
-                    "mcp_wrapper": f"http://localhost:{self.external_port}/mcp"
-                },
-                "protocols": ["MCP over HTTP/SSE"]
-            }
-        
-        @self.proxy_app.get("/health")
-        async def health():
-            """Health check endpoint"""
-            try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(f"http://localhost:{self.rest_port}/health", timeout=5.0)
-                    return response.json()
-            except Exception as e:
-                logger.error(f"Health check failed: {e}")
-                return {"status": "unhealthy", "error": str(e)}
-        
-        @self.proxy_app.api_route("/mcp", methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"])
-        async def mcp_proxy_root(request: Request):
-            """Proxy MCP wrapper requests to root"""
-            try:
-                url = f"http://localhost:{self.mcp_port}/mcp"
-                async with httpx.AsyncClient() as client:
-                    response = await client.request(
-                        method=request.method,
-                        url=url,
-                        headers=dict(request.headers),
-                        content=await request.body(),
-                        timeout=30.0
-                    )
-                    return Response(
-                        content=response.content,
-                        status_code=response.status_code,
-                        headers=dict(response.headers)
-                    )
-            except Exception as e:
-                logger.error(f"MCP proxy error: {e}")
-                return Response(
-                    content=f"Proxy error: {str(e)}",
-                    status_code=500
-                )
-
-        @self.proxy_app.api_route("/mcp/{path:path}", methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"])
-        async def mcp_proxy(request: Request, path: str):
-            """Proxy MCP wrapper requests with path"""
+        # Each worker loads the full judge chain and embedding model, so scale out only on request
+        self.workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+        # MCP wrapper tools call the REST API through ASGI, not over TCP
+        mcp_wrapper.REST_API_APP = rest_app
+        # Sessions live in one process, so run stateless when requests spread across workers
+        if stateless_http is None:
+            stateless_http = os.getenv("MCP_STATELESS_HTTP", str(self.workers > 1)).lower() == "true"
+        self.stateless_http = stateless_http
+        self.mcp_app = mcp_wrapper.mcp.http_app(path="/mcp", transport="streamable-http", stateless_http=stateless_http)
+        self.app = FastAPI(title="MCP Evaluation Server", lifespan=self.lifespan, docs_url=None, redoc_url=None, openapi_url=None)
+        self.setup_routes()
+
+    @asynccontextmanager
+    async def lifespan(self, app: FastAPI):
+        """Run the REST API startup hook and the FastMCP session manager.
+
+        Starlette does not run the lifespan of mounted sub-apps, so both are
+        entered here explicitly.
+        """
+        await rest_startup_event()
+        async with self.mcp_app.lifespan(app):
             try:
-                url = f"http://localhost:{self.mcp_port}/mcp/{path}"
-                async with httpx.AsyncClient() as client:
-                    response = await client.request(
-                        method=request.method,
-                        url=url,
-                        headers=dict(request.headers),
-                        content=await request.body(),
-                        timeout=30.0
-                    )
-                    return Response(
-                        content=response.content,
-                        status_code=response.status_code,
-                        headers=dict(response.headers)
-                    )
-            except Exception as e:
-                logger.error(f"MCP proxy error: {e}")
-                return Response(
-                    content=f"Proxy error: {str(e)}",
-                    status_code=500
-                )
-        
-    
-    def start_rest_api(self):
-        """Start the REST API server"""
-        logger.info(f"🌐 Starting REST API server on port {self.rest_port}...")
-        self.rest_process = subprocess.Popen([
-            sys.executable, "-m", "mcp_eval_server.rest_server",
-            "--port", str(self.rest_port),
-            "--host", "127.0.0.1"
-        ])
-        logger.info(f"✅ REST API server started (PID: {self.rest_process.pid})")
-    
-    def start_mcp_wrapper(self):
-        """Start the MCP wrapper server"""
-        logger.info(f"⏳ Waiting for REST API to be ready...")
-        time.sleep(5)
-        
-        logger.info(f"🔗 Starting MCP wrapper server on port {self.mcp_port}...")
-        self.mcp_process = subprocess.Popen([
-            sys.executable, "-m", "mcp_eval_server.mcp_wrapper",
-            "--rest-url", f"http://127.0.0.1:{self.rest_port}",
-            "--host", "127.0.0.1",
-            "--port", str(self.mcp_port)
-        ])
-        logger.info(f"✅ MCP wrapper server started (PID: {self.mcp_process.pid})")
-    
-    def cleanup(self):
-        """Cleanup processes"""
-        logger.info("🛑 Shutting down servers...")
-        if self.rest_process:
-            self.rest_process.terminate()
-            self.rest_process.wait()
-        if self.mcp_process:
-            self.mcp_process.terminate()
-            self.mcp_process.wait()
-    
+                yield
+            finally:
+                await mcp_wrapper.rest_client.aclose()
+
+    def setup_routes(self):
+        """Route /mcp to the MCP wrapper and everything else to the REST API"""
+
+        # Exact-path routes hand the untouched scope to the FastMCP app, which serves /mcp itself
+        self.app.add_route("/mcp", self.mcp_app, include_in_schema=False)
+        self.app.add_route("/mcp/", self.mcp_app, include_in_schema=False)
+
+        # REST API served in-process at the root, including / and /health
+        self.app.mount("/", rest_app)
+
+    def bind_socket(self) -> socket.socket:
+        """Create the listening socket with TCP_NODELAY and SO_REUSEPORT set.
+
+        Accepted connections inherit TCP_NODELAY, so small JSON-RPC messages are
+        never held back by Nagle's algorithm regardless of the event loop used.
+        SO_REUSEPORT lets every worker bind its own socket to the same port and
+        have the kernel balance incoming connections across them.
+        """
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if hasattr(socket, "SO_REUSEPORT"):
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.bind(("0.0.0.0", self.external_port))
+        sock.set_inheritable(True)
+        return sock
+
     def run(self):
-        """Run the proxy server"""
+        """Run the server"""
         logger.info("🚀 Starting MCP Evaluation Server on AWS App Runner...")
         logger.info(f"📡 Protocol: MCP Wrapper (SSE) only")
-        logger.info(f"🌍 REST API Port: {self.rest_port} (internal only)")
-        logger.info(f"🌍 MCP Wrapper Port: {self.mcp_port} (internal)")
-        logger.info(f"🔗 External Port: {self.external_port} (MCP only)")
-        
-        # Log available judges
-        try:
-            from mcp_eval_server.tools.judge_tools import JudgeTools
-            jt = JudgeTools()
-            judges = jt.get_available_judges()
-            logger.info("⚖️  Available judges:")
-            for judge in judges:
-                logger.info(f"  - {judge}")
-        except Exception as e:
-            logger.warning(f"Could not load judges: {e}")
-        
-        # Set up signal handlers
-        def signal_handler(signum, frame):
-            logger.info(f"Received signal {signum}")
-            self.cleanup()
-            sys.exit(0)
-        
-        signal.signal(signal.SIGTERM, signal_handler)
-        signal.signal(signal.SIGINT, signal_handler)
-        
-        # Start both servers
-        self.start_rest_api()
-        self.start_mcp_wrapper()
-        
-        logger.info("🎉 Both servers are running!")
+        logger.info("🌍 REST API: mounted in-process at /")
+        logger.info("🌍 MCP Wrapper: mounted in-process at /mcp")
+        logger.info(f"🔗 External Port: {self.external_port}")
+        logger.info(f"⚙️  Event loop: {EVENT_LOOP}, HTTP parser: {HTTP_PROTOCOL}, workers: {self.workers}, stateless MCP: {self.stateless_http}")
+
+        if os.getenv("LOG_JUDGES", "0") == "1":
+            _log_judges()
+
         logger.info(f"🔗 MCP Wrapper: http://0.0.0.0:{self.external_port}/mcp")
         logger.info(f"🏥 Health Check: http://0.0.0.0:{self.external_port}/health")
-        logger.info(f"📚 REST API: http://localhost:{self.rest_port}/docs (internal only)")
-        
-        # Start the proxy server
-        try:
-            uvicorn.run(
-                self.proxy_app,
-                host="0.0.0.0",
-                port=self.external_port,
-                log_level="info"
-            )
-        except KeyboardInterrupt:
-            logger.info("Received keyboard interrupt")
-        finally:
-            self.cleanup()
+        logger.info(f"📚 REST API: http://0.0.0.0:{self.external_port}/docs")
+
+        if self.workers == 1:
+            self.serve()
+            return
+
+        # One process per worker, each accepting on its own SO_REUSEPORT socket
+        context = multiprocessing.get_context("spawn")
+        processes = [context.Process(target=serve_worker, name=f"worker-{i}") for i in range(self.workers)]
+        for process in processes:
+            process.start()
+
+        stopping = False
+
+        def stop_workers():
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+            # Workers that have not exited once their graceful shutdown is over get SIGKILL
+            deadline = time.monotonic() + GRACEFUL_SHUTDOWN_TIMEOUT + KILL_TIMEOUT
+            for process in processes:
+                process.join(max(0.0, deadline - time.monotonic()))
+            for process in processes:
+                if process.is_alive():
+                    logger.warning(f"{process.name} did not stop in time, killing it")
+                    process.kill()
+
+        def handle_signal(signum, frame):
+            nonlocal stopping
+            stopping = True
+            logger.info(f"Received signal {signum}, stopping workers")
+            stop_workers()
+
+        signal.signal(signal.SIGTERM, handle_signal)
+        signal.signal(signal.SIGINT, handle_signal)
+
+        # Outside a shutdown any worker exiting is a failure: stop the rest and exit non-zero
+        # so the orchestrator restarts the whole service instead of running with fewer workers
+        exited = multiprocessing.connection.wait([process.sentinel for process in processes])
+        if not stopping:
+            for process in processes:
+                if process.sentinel in exited:
+                    process.join()
+                    logger.error(f"{process.name} exited unexpectedly with code {process.exitcode}, stopping the server")
+            stop_workers()
+        for process in processes:
+            process.join()
+        if not stopping:
+            sys.exit(1)
+
+    def serve(self):
+        """Serve the app in this process"""
+        # uvicorn handles SIGINT/SIGTERM and runs the lifespan shutdown
+        config = uvicorn.Config(
+            self.app,
+            host="0.0.0.0",
+            port=self.external_port,
+            loop=EVENT_LOOP,
+            http=HTTP_PROTOCOL,
+            timeout_keep_alive=KEEP_ALIVE_TIMEOUT,
+            timeout_graceful_shutdown=GRACEFUL_SHUTDOWN_TIMEOUT,
+            access_log=False,  # per-request log lines cost more than the requests they describe
+            log_level="info"
+        )
+        uvicorn.Server(config).run(sockets=[self.bind_socket()])
+
+
+def build_app(stateless_http: Optional[bool] = None) -> FastAPI:
+    """App factory for running under an external ASGI server, e.g. `uvicorn --factory startup_proxy:build_app`
+
+    The external server decides the process count, which this app cannot see. MCP sessions
+    live in the process that created them, so when running more than one process (e.g.
+    `--workers 4`) set MCP_STATELESS_HTTP=true or pass stateless_http=True. Otherwise
+    statelessness follows WEB_CONCURRENCY, which is off for a single worker.
+    """
+    return MCPEvaluationServer(stateless_http=stateless_http).app
+
+
+def serve_worker():
+    """Entry point of a worker process"""
+    MCPEvaluationServer().serve()
+
 
 if __name__ == "__main__":
     server = MCPEvaluationServer()
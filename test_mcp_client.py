@@ -1,11 +1,37 @@
 #!/usr/bin/env python3
-"""Test the MCP wrapper with an actual MCP client."""
+"""Test the MCP wrapper with an actual MCP client over stdio.
+
+The wrapper is launched with --transport stdio and forwards tool calls to the
+REST API, which must be running. Run with: pytest test_mcp_client.py
+(REST_API_URL overrides the REST API address)
+"""
 
 import asyncio
-import json
-import subprocess
+import itertools
+import logging
+import os
 import sys
-from typing import Dict, Any
+from typing import Dict, Any, List
+
+import orjson
+import pytest
+import pytest_asyncio
+
+logger = logging.getLogger(__name__)
+
+# Every test shares one event loop, and with it one wrapper process and MCP session
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+# Seconds to wait for the replies to a batch before failing the test instead of hanging
+REQUEST_TIMEOUT = 30.0
+
+REST_API_URL = os.getenv("REST_API_URL", "http://localhost:8080")
+
+WRAPPER_COMMAND = [
+    sys.executable, "-m", "mcp_eval_server.mcp_wrapper",
+    "--transport", "stdio",
+    "--rest-url", REST_API_URL
+]
 
 class MCPClient:
     """Simple MCP client for testing the wrapper."""
@@ -13,127 +39,170 @@ class MCPClient:
     def __init__(self, server_command: list):
         self.server_command = server_command
         self.process = None
+        self._ids = itertools.count(1)
+        # Replies not yet received, by request id
+        self._pending: Dict[Any, "asyncio.Future[Dict[str, Any]]"] = {}
+        self._reader = None
     
     async def start_server(self):
         """Start the MCP server process."""
-        print(f"🚀 Starting MCP server: {' '.join(self.server_command)}")
+        logger.info(f"🚀 Starting MCP server: {' '.join(self.server_command)}")
         self.process = await asyncio.create_subprocess_exec(
             *self.server_command,
             stdin=asyncio.subprocess.PIPE,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
+            stdout=asyncio.subprocess.PIPE
         )
-        print("✅ MCP server started")
+        self._reader = asyncio.create_task(self._read_responses())
+        logger.info("✅ MCP server started")
     
     async def send_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Send a JSON-RPC request to the MCP server."""
+        responses = await self.send_batch([request])
+        return responses[0] if responses else {}
+    
+    async def send_batch(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Send several JSON-RPC messages in one write and collect the replies.
+        
+        The stdio transport takes one message per line, so the messages are
+        written back to back and the background reader hands each reply to
+        the request with its id. Notifications get no reply. Calls may run
+        concurrently.
+        """
         if not self.process:
             raise RuntimeError("Server not started")
+        if self._reader.done():
+            raise RuntimeError("Server connection is closed")
+        
+        loop = asyncio.get_running_loop()
+        futures = []
+        for request in requests:
+            if "id" in request:
+                future = self._pending[request["id"]] = loop.create_future()
+                futures.append(future)
         
-        request_json = json.dumps(request) + "\n"
-        print(f"📤 Sending: {request_json.strip()}")
+        messages = [orjson.dumps(request) for request in requests]
+        if logger.isEnabledFor(logging.DEBUG):
+            for message in messages:
+                logger.debug(f"📤 Sending: {message.decode()}")
         
-        self.process.stdin.write(request_json.encode())
+        # One buffered write of messages and delimiters, without concatenating them first
+        self.process.stdin.writelines(part for message in messages for part in (message, b"\n"))
         await self.process.stdin.drain()
         
-        # Read response
-        response_line = await self.process.stdout.readline()
-        response_json = response_line.decode().strip()
-        print(f"📥 Received: {response_json}")
+        return list(await asyncio.wait_for(asyncio.gather(*futures), REQUEST_TIMEOUT))
+    
+    async def _read_responses(self):
+        """Resolve pending requests with the server's replies as they arrive.
         
-        return json.loads(response_json)
+        Whatever stops the reader, be it EOF or a reply it cannot handle, is
+        passed on to every request still waiting so none of them hangs.
+        """
+        error: BaseException = RuntimeError("Server closed stdout before answering")
+        try:
+            while True:
+                response_line = await self.process.stdout.readline()
+                if not response_line:
+                    break
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"📥 Received: {response_line.decode().strip()}")
+                response = orjson.loads(response_line)
+                if not isinstance(response, dict):
+                    raise RuntimeError(f"Unexpected reply from server: {response_line!r}")
+                future = self._pending.pop(response.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except Exception as e:
+            error = e
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(error)
+            self._pending.clear()
+    
+    def build_request(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a JSON-RPC request with a fresh id."""
+        return {
+            "jsonrpc": "2.0",
+            "id": next(self._ids),
+            "method": method,
+            "params": params
+        }
     
     async def initialize(self) -> Dict[str, Any]:
         """Initialize the MCP session."""
-        request = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "initialize",
-            "params": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {},
-                "clientInfo": {
-                    "name": "test-client",
-                    "version": "1.0.0"
-                }
+        request = self.build_request("initialize", {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {},
+            "clientInfo": {
+                "name": "test-client",
+                "version": "1.0.0"
             }
-        }
-        response = await self.send_request(request)
-        
-        # Send initialized notification
+        })
+        # Send the initialized notification in the same write
         notification = {
             "jsonrpc": "2.0",
             "method": "notifications/initialized"
         }
-        await self.send_request(notification)
+        response, = await self.send_batch([request, notification])
         
         return response
     
     async def list_tools(self) -> Dict[str, Any]:
         """List available tools."""
-        request = {
-            "jsonrpc": "2.0",
-            "id": 2,
-            "method": "tools/list",
-            "params": {}
-        }
-        return await self.send_request(request)
+        return await self.send_request(self.build_request("tools/list", {}))
     
     async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Call a specific tool."""
-        request = {
-            "jsonrpc": "2.0",
-            "id": 3,
-            "method": "tools/call",
-            "params": {
-                "name": name,
-                "arguments": arguments
-            }
-        }
-        return await self.send_request(request)
+        return await self.send_request(self.tool_request(name, arguments))
+    
+    def tool_request(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a tools/call request."""
+        return self.build_request("tools/call", {
+            "name": name,
+            "arguments": arguments
+        })
     
     async def close(self):
         """Close the MCP server process."""
         if self.process:
             self.process.terminate()
             await self.process.wait()
-            print("✅ MCP server closed")
+            await self._reader
+            logger.info("✅ MCP server closed")
 
-async def test_mcp_wrapper():
-    """Test the MCP wrapper with a real MCP client."""
-    print("🧪 Testing MCP wrapper with actual MCP client...")
-    print("=" * 60)
-    
-    # Create MCP client
-    client = MCPClient([
-        sys.executable, "-m", "mcp_eval_server.mcp_wrapper",
-        "--rest-url", "http://localhost:8080"
-    ])
-    
+def tool_payload(response: Dict[str, Any]) -> Dict[str, Any]:
+    """Check that a tools/call reply succeeded and decode the JSON the tool returned."""
+    assert 'result' in response, f"Tool call failed: {response}"
+    result = response['result']
+    assert not result.get('isError'), f"Tool reported an error: {result}"
+    return orjson.loads(result['content'][0]['text'])
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    """Start the MCP wrapper and initialize one session for all tests."""
+    client = MCPClient(WRAPPER_COMMAND)
+    await client.start_server()
     try:
-        # Start the server
-        await client.start_server()
-        
-        # Initialize the session
-        print("\n1️⃣ Initializing MCP session...")
-        init_response = await client.initialize()
-        print(f"✅ Initialization successful: {init_response.get('result', {}).get('serverInfo', {}).get('name', 'Unknown')}")
-        
-        # List tools
-        print("\n2️⃣ Listing available tools...")
-        tools_response = await client.list_tools()
-        tools = tools_response.get('result', {}).get('tools', [])
-        print(f"✅ Found {len(tools)} tools")
-        
-        # Show some tool names
-        tool_names = [tool['name'] for tool in tools[:10]]
-        print(f"   Sample tools: {', '.join(tool_names)}")
-        if len(tools) > 10:
-            print(f"   ... and {len(tools) - 10} more")
-        
-        # Test a simple tool call
-        print("\n3️⃣ Testing tool call...")
-        test_response = await client.call_tool("judge_evaluate", {
+        client.init_response = await client.initialize()
+        yield client
+    finally:
+        await client.close()
+
+
+async def test_initialize(client):
+    """Test that the session initialized."""
+    server_name = client.init_response.get('result', {}).get('serverInfo', {}).get('name')
+    print(f"✅ Initialization successful: {server_name}")
+    assert server_name
+
+
+async def test_tools(client):
+    """Test listing tools and calling tools."""
+    # List tools and run the tool calls in one batch; they do not depend on each other
+    tools_response, test_response, server_info = await client.send_batch([
+        client.build_request("tools/list", {}),
+        client.tool_request("judge_evaluate", {
             "response": "Paris is the capital of France.",
             "criteria": [
                 {
@@ -151,35 +220,24 @@ async def test_mcp_wrapper():
                 }
             },
             "judge_model": "rule-based"
-        })
-        
-        if 'result' in test_response:
-            result = test_response['result']
-            print(f"✅ Tool call successful!")
-            print(f"   Overall score: {result.get('overall_score', 'N/A')}")
-            print(f"   Confidence: {result.get('confidence', 'N/A')}")
-            print(f"   Judge model: {result.get('judge_model', 'N/A')}")
-        else:
-            print(f"❌ Tool call failed: {test_response}")
-        
-        # Test server info tool
-        print("\n4️⃣ Testing server info tool...")
-        server_info = await client.call_tool("get_server_info", {})
-        if 'result' in server_info:
-            print(f"✅ Server info retrieved successfully")
-            print(f"   Server: {server_info['result'].get('server_name', 'Unknown')}")
-        else:
-            print(f"❌ Server info failed: {server_info}")
-        
-        print("\n✅ MCP wrapper test completed successfully!")
-        
-    except Exception as e:
-        print(f"❌ Test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        }),
+        client.tool_request("get_server_info", {}),
+    ])
     
-    finally:
-        await client.close()
+    tools = tools_response.get('result', {}).get('tools', [])
+    print(f"✅ Found {len(tools)} tools")
+    print(f"   Sample tools: {', '.join(tool['name'] for tool in tools[:10])}")
+    assert tools
+    
+    result = tool_payload(test_response)
+    print(f"✅ Tool call successful!")
+    print(f"   Overall score: {result.get('overall_score', 'N/A')}")
+    print(f"   Confidence: {result.get('confidence', 'N/A')}")
+    print(f"   Judge model: {result.get('judge_model', 'N/A')}")
+    assert result['judge_model'] == 'rule-based'
+    
+    assert tool_payload(server_info).get('name'), f"Server info failed: {server_info}"
+    print(f"✅ Server info retrieved successfully")
 
 if __name__ == "__main__":
-    asyncio.run(test_mcp_wrapper())
+    sys.exit(pytest.main([__file__]))
@@ -1,10 +1,25 @@
 #!/usr/bin/env python3
-"""Test the MCP wrapper with proper SSE client."""
+"""Test the MCP wrapper with proper SSE client.
+
+Run against a running wrapper with: pytest test_sse_client.py (MCP_URL overrides the endpoint)
+"""
 
 import asyncio
+import logging
+import os
+import sys
+
 import httpx
-import json
-import re
+import orjson
+import pytest
+import pytest_asyncio
+
+logger = logging.getLogger(__name__)
+
+# Every test shares one event loop, and with it one HTTP connection pool and MCP session
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+MCP_URL = os.getenv("MCP_URL", "http://localhost:9001/mcp")
 
 class SSEClient:
     """Simple SSE client for testing streamable-http transport."""
@@ -12,7 +27,15 @@ class SSEClient:
     def __init__(self, base_url: str):
         self.base_url = base_url
         self.session_id = None
-        self.client = httpx.AsyncClient()
+        # Per-session request headers, rebuilt only when the session id changes
+        self._headers = None
+        # Keep connections to the single server alive between requests
+        self.client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32, keepalive_expiry=120.0),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            headers={"Accept": "application/json, text/event-stream", "Content-Type": "application/json"},
+            trust_env=False
+        )
     
     async def __aenter__(self):
         return self
@@ -22,137 +45,137 @@ class SSEClient:
     
     async def send_request(self, request: dict) -> dict:
         """Send a JSON-RPC request and parse SSE response."""
-        headers = {"Accept": "application/json, text/event-stream"}
-        if self.session_id:
-            headers["mcp-session-id"] = self.session_id
-        
-        response = await self.client.post(
+        async with self.client.stream(
+            "POST",
             self.base_url,
-            json=request,
-            headers=headers,
-            timeout=30.0
-        )
-        
-        if response.status_code not in [200, 202]:
-            raise Exception(f"HTTP {response.status_code}: {response.text}")
-        
-        # For notifications (202), return empty result
-        if response.status_code == 202:
-            return {}
-        
-        # Extract session ID from response headers
-        if "mcp-session-id" in response.headers:
-            self.session_id = response.headers["mcp-session-id"]
-            print(f"Session ID: {self.session_id}")
+            content=orjson.dumps(request),
+            headers=self._headers
+        ) as response:
+            if response.status_code not in [200, 202]:
+                await response.aread()
+                raise Exception(f"HTTP {response.status_code}: {response.text}")
+            
+            # For notifications (202), return empty result
+            if response.status_code == 202:
+                return {}
+            
+            # Extract session ID from response headers
+            session_id = response.headers.get("mcp-session-id")
+            if session_id is not None and session_id != self.session_id:
+                self.session_id = session_id
+                self._headers = {"mcp-session-id": session_id}
+                logger.debug("Session ID: %s", session_id)
+            
+            if response.headers.get("content-type", "").startswith("application/json"):
+                return orjson.loads(await response.aread())
+            
+            # Parse SSE events as they arrive; the first complete event carries the reply
+            data_lines = []
+            async for line in response.aiter_lines():
+                if line.startswith("data:"):
+                    data_lines.append(line[5:].lstrip())
+                elif line == "" and data_lines:
+                    data = "\n".join(data_lines)
+                    logger.debug("SSE event data: %d bytes", len(data))
+                    return orjson.loads(data)
         
-        # Parse SSE response
-        content = response.text
-        print(f"Raw SSE response: {content}")
+        raise Exception("SSE stream ended without a data event")
+
+def tool_payload(response: dict) -> dict:
+    """Check that a tools/call reply succeeded and decode the JSON the tool returned."""
+    assert 'result' in response, f"Tool call failed: {response}"
+    result = response['result']
+    assert not result.get('isError'), f"Tool reported an error: {result}"
+    return orjson.loads(result['content'][0]['text'])
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    """Open one client and initialize one MCP session for all tests."""
+    async with SSEClient(MCP_URL) as client:
+        init_request = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "initialize",
+            "params": {
+                "protocolVersion": "2024-11-05",
+                "capabilities": {},
+                "clientInfo": {
+                    "name": "test-client",
+                    "version": "1.0.0"
+                }
+            }
+        }
+        client.init_response = await client.send_request(init_request)
         
-        # Extract JSON from SSE format
-        # Look for "data: {json}" pattern
-        data_match = re.search(r'data:\s*(\{.*\})', content)
-        if data_match:
-            json_str = data_match.group(1)
-            return json.loads(json_str)
-        else:
-            raise Exception(f"Could not parse SSE response: {content}")
+        # Send initialized notification
+        initialized_notification = {
+            "jsonrpc": "2.0",
+            "method": "notifications/initialized"
+        }
+        await client.send_request(initialized_notification)
+        yield client
 
-async def test_sse_wrapper():
-    """Test the MCP wrapper with SSE client."""
-    print("🧪 Testing MCP wrapper with SSE client...")
-    print("=" * 60)
+
+async def test_initialize(client):
+    """Test that the session initialized."""
+    server_name = client.init_response.get('result', {}).get('serverInfo', {}).get('name')
+    print(f"✅ Initialization successful: {server_name}")
+    assert server_name
+
+
+async def test_tools(client):
+    """Test listing tools and calling a tool."""
+    # List tools and call a tool concurrently; both only need the session from init
+    tools_request = {
+        "jsonrpc": "2.0",
+        "id": 2,
+        "method": "tools/list",
+        "params": {}
+    }
     
-    async with SSEClient("http://localhost:9001/mcp/") as client:
-        try:
-            # Test 1: Initialize
-            print("\n1️⃣ Testing initialization...")
-            init_request = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "initialize",
-                "params": {
-                    "protocolVersion": "2024-11-05",
-                    "capabilities": {},
-                    "clientInfo": {
-                        "name": "test-client",
-                        "version": "1.0.0"
+    tool_request = {
+        "jsonrpc": "2.0",
+        "id": 3,
+        "method": "tools/call",
+        "params": {
+            "name": "judge_evaluate",
+            "arguments": {
+                "response": "Paris is the capital of France.",
+                "criteria": [
+                    {
+                        "name": "accuracy",
+                        "description": "Factual accuracy",
+                        "scale": "1-5",
+                        "weight": 1.0
                     }
-                }
-            }
-            
-            result = await client.send_request(init_request)
-            print(f"✅ Initialization successful: {result.get('result', {}).get('serverInfo', {}).get('name', 'Unknown')}")
-            
-            # Send initialized notification
-            print("\n📢 Sending initialized notification...")
-            initialized_notification = {
-                "jsonrpc": "2.0",
-                "method": "notifications/initialized"
-            }
-            await client.send_request(initialized_notification)
-            print("✅ Initialized notification sent")
-            
-            # Test 2: List tools
-            print("\n2️⃣ Testing tools list...")
-            tools_request = {
-                "jsonrpc": "2.0",
-                "id": 2,
-                "method": "tools/list",
-                "params": {}
-            }
-            
-            result = await client.send_request(tools_request)
-            tools = result.get('result', {}).get('tools', [])
-            print(f"✅ Found {len(tools)} tools")
-            if tools:
-                print(f"   Sample tools: {', '.join([tool['name'] for tool in tools[:5]])}")
-            
-            # Test 3: Call a tool
-            print("\n3️⃣ Testing tool call...")
-            tool_request = {
-                "jsonrpc": "2.0",
-                "id": 3,
-                "method": "tools/call",
-                "params": {
-                    "name": "judge_evaluate",
-                    "arguments": {
-                        "response": "Paris is the capital of France.",
-                        "criteria": [
-                            {
-                                "name": "accuracy",
-                                "description": "Factual accuracy",
-                                "scale": "1-5",
-                                "weight": 1.0
-                            }
-                        ],
-                        "rubric": {
-                            "criteria": [],
-                            "scale_description": {
-                                "1": "Wrong",
-                                "5": "Correct"
-                            }
-                        },
-                        "judge_model": "rule-based"
+                ],
+                "rubric": {
+                    "criteria": [],
+                    "scale_description": {
+                        "1": "Wrong",
+                        "5": "Correct"
                     }
-                }
+                },
+                "judge_model": "rule-based"
             }
-            
-            result = await client.send_request(tool_request)
-            if 'result' in result:
-                tool_result = result['result']
-                print(f"✅ Tool call successful!")
-                print(f"   Overall score: {tool_result.get('overall_score', 'N/A')}")
-                print(f"   Confidence: {tool_result.get('confidence', 'N/A')}")
-            else:
-                print(f"❌ Tool call failed: {result}")
-            
-            print("\n✅ SSE wrapper test completed successfully!")
-            
-        except Exception as e:
-            print(f"❌ Test failed: {e}")
-            import traceback
-            traceback.print_exc()
+        }
+    }
+    
+    tools_result, result = await asyncio.gather(
+        client.send_request(tools_request),
+        client.send_request(tool_request)
+    )
+    
+    tools = tools_result.get('result', {}).get('tools', [])
+    print(f"✅ Found {len(tools)} tools")
+    print(f"   Sample tools: {', '.join(tool['name'] for tool in tools[:5])}")
+    assert tools
+    
+    tool_result = tool_payload(result)
+    print(f"✅ Tool call successful!")
+    print(f"   Overall score: {tool_result.get('overall_score', 'N/A')}")
+    print(f"   Confidence: {tool_result.get('confidence', 'N/A')}")
 
 if __name__ == "__main__":
-    asyncio.run(test_sse_wrapper())
\ No newline at end of file
+    sys.exit(pytest.main([__file__]))
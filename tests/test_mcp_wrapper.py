@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""Tests for the MCP wrapper's REST API call helpers."""
+
+# Standard
+import asyncio
+
+# Third-Party
+import httpx
+from mcp_eval_server import mcp_wrapper
+import numpy as np
+import orjson
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Start every test with empty wrapper caches."""
+    mcp_wrapper._get_cache.clear()
+    mcp_wrapper._response_cache.clear()
+    yield
+    mcp_wrapper._get_cache.clear()
+    mcp_wrapper._response_cache.clear()
+
+
+class FakeRESTClient:
+    """Records upstream calls instead of making HTTP requests."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def get_raw(self, endpoint, **kwargs):
+        self.calls.append(("GET", endpoint, None))
+        await asyncio.sleep(0.01)
+        return b'{"endpoint": "%s"}' % endpoint.encode()
+
+    async def post_raw(self, endpoint, data, **kwargs):
+        self.calls.append(("POST", endpoint, data))
+        return b'{"endpoint": "%s"}' % endpoint.encode()
+
+
+class JudgeToolsStub:
+    """Stands in for the REST app's JudgeTools instance."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def evaluate_with_reference(self, **kwargs):
+        self.calls += 1
+        return {"judge_model": kwargs["judge_model"]}
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    """Replace the shared REST client with a recording fake."""
+    client = FakeRESTClient()
+    monkeypatch.setattr(mcp_wrapper, "rest_client", client)
+    return client
+
+
+class TestRESTAPIClient:
+    """Test the pooled REST API client."""
+
+    async def test_concurrent_identical_posts_are_coalesced(self):
+        """Test that identical in-flight POSTs share one upstream request."""
+        requests = []
+
+        async def handler(request):
+            requests.append(request)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"ok": True})
+
+        client = mcp_wrapper.RESTAPIClient(base_url="http://rest-api")
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url="http://rest-api")
+        try:
+            same = [client.post("/judge/evaluate", {"response": "x"}) for _ in range(5)]
+            other = client.post("/judge/evaluate", {"response": "y"})
+            results = await asyncio.gather(*same, other)
+        finally:
+            await client.aclose()
+
+        assert len(requests) == 2
+        assert all(result == {"ok": True} for result in results)
+        assert not client._inflight
+
+
+class TestEncoding:
+    """Test tool response encoding."""
+
+    def test_encode_is_compact_json(self):
+        """Test that results are formatted like the REST API's JSON bodies."""
+        assert mcp_wrapper._encode({"a": 1, "b": [1, 2]}) == '{"a":1,"b":[1,2]}'
+
+    def test_encode_serializes_numpy(self):
+        """Test that numpy values returned by the tools are encoded."""
+        assert mcp_wrapper._encode({"scores": np.array([1, 2])}) == '{"scores":[1,2]}'
+
+    def test_content_key_ignores_key_order(self):
+        """Test that cache keys do not depend on dict ordering."""
+        key_a = mcp_wrapper._content_key("/judge/reference", {"a": 1, "b": 2})
+        key_b = mcp_wrapper._content_key("/judge/reference", {"b": 2, "a": 1})
+        assert key_a == key_b
+        assert key_a != mcp_wrapper._content_key("/rag/answer-groundedness", {"a": 1, "b": 2})
+
+
+class TestCachedGet:
+    """Test TTL caching of idempotent GET endpoints."""
+
+    async def test_concurrent_misses_share_one_request(self, fake_client):
+        """Test that concurrent callers coalesce onto a single upstream GET."""
+        results = await asyncio.gather(*(mcp_wrapper.cached_get("/health", ttl=30.0) for _ in range(10)))
+
+        assert len(fake_client.calls) == 1
+        assert len(set(results)) == 1
+
+    async def test_expired_entry_is_refetched(self, fake_client):
+        """Test that an entry past its TTL triggers a new request."""
+        await mcp_wrapper.cached_get("/tools", ttl=0.0)
+        await mcp_wrapper.cached_get("/tools", ttl=0.0)
+
+        assert len(fake_client.calls) == 2
+
+
+class TestCachedPost:
+    """Test memoization of deterministic judge calls."""
+
+    async def test_deterministic_judge_is_cached(self, fake_client):
+        """Test that repeat rule-based requests are served from the cache."""
+        data = {"response": "x", "reference": "y", "judge_model": "rule-based"}
+
+        first = await mcp_wrapper.cached_post("/judge/reference", data)
+        second = await mcp_wrapper.cached_post("/judge/reference", dict(data))
+
+        assert first == second
+        assert len(fake_client.calls) == 1
+
+    async def test_llm_judge_is_not_cached(self, fake_client):
+        """Test that sampling LLM judges always reach the REST API."""
+        data = {"response": "x", "reference": "y", "judge_model": "gpt-4o-mini"}
+
+        await mcp_wrapper.cached_post("/judge/reference", data)
+        await mcp_wrapper.cached_post("/judge/reference", data)
+
+        assert len(fake_client.calls) == 2
+
+    async def test_every_model_field_must_be_deterministic(self, fake_client):
+        """Test that a non-deterministic fact checking model disables caching."""
+        data = {"response": "x", "judge_model": "rule-based", "fact_checking_model": "gpt-4"}
+
+        await mcp_wrapper.cached_post("/quality/factuality", data)
+        await mcp_wrapper.cached_post("/quality/factuality", data)
+
+        assert len(fake_client.calls) == 2
+
+    async def test_cache_opt_out(self, fake_client):
+        """Test that cache=False bypasses the cache."""
+        data = {"response": "x", "reference": "y", "judge_model": "rule-based"}
+
+        await mcp_wrapper.cached_post("/judge/reference", data, cache=False)
+        await mcp_wrapper.cached_post("/judge/reference", data, cache=False)
+
+        assert len(fake_client.calls) == 2
+
+
+class TestLocalDispatch:
+    """Test in-process dispatch to the evaluation tools."""
+
+    async def test_local_dispatch_skips_rest_api(self, fake_client, monkeypatch):
+        """Test that enabled local dispatch calls the tool method directly."""
+        monkeypatch.setattr(mcp_wrapper, "LOCAL_DISPATCH", True)
+
+        result = await mcp_wrapper.judge_reference("Paris is the capital of France.", "Paris is the capital of France.", judge_model="rule-based", cache=False)
+
+        assert not fake_client.calls
+        assert orjson.loads(result)["judge_model"] == "rule-based"
+
+    async def test_reuses_in_process_rest_api_tools(self, fake_client, monkeypatch):
+        """Test that the REST app's tool instances are shared when it runs in-process."""
+        # Local
+        from mcp_eval_server import rest_server
+
+        judge = JudgeToolsStub()
+        monkeypatch.setattr(mcp_wrapper, "LOCAL_DISPATCH", True)
+        monkeypatch.setattr(mcp_wrapper, "REST_API_APP", rest_server.app)
+        monkeypatch.setitem(rest_server.tools, "judge", judge)
+
+        result = await mcp_wrapper.judge_reference("x", "y", judge_model="rule-based", cache=False)
+
+        assert not fake_client.calls
+        assert judge.calls == 1
+        assert orjson.loads(result) == {"judge_model": "rule-based"}
+
+    async def test_falls_back_to_rest_api(self, fake_client, monkeypatch):
+        """Test that calls go through the REST API when the tools cannot load."""
+        monkeypatch.setattr(mcp_wrapper, "LOCAL_DISPATCH", True)
+        monkeypatch.setattr(mcp_wrapper, "_local_tools", lambda: None)
+
+        await mcp_wrapper.judge_reference("x", "y", judge_model="rule-based", cache=False)
+
+        assert len(fake_client.calls) == 1
+
+
+class TestRequestBodies:
+    """Test construction of REST API request bodies."""
+
+    async def test_omitted_optional_fields_are_not_sent(self, fake_client):
+        """Test that optional fields left as None are dropped from the body."""
+        await mcp_wrapper.judge_evaluate("x", [], {}, judge_model="rule-based")
+
+        assert fake_client.calls == [("POST", "/judge/evaluate", {"response": "x", "criteria": [], "rubric": {}, "judge_model": "rule-based", "use_cot": True})]
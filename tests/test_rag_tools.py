@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""Tests for the RAG tools' local semantic similarity."""
+
+# Third-Party
+from mcp_eval_server.tools import rag_tools
+from mcp_eval_server.tools.rag_tools import RAGTools
+import numpy as np
+import pytest
+
+
+class FakeEmbeddingModel:
+    """Embeds texts by length and records what it was asked to encode."""
+
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, texts):
+        self.encoded.append(list(texts))
+        return np.array([[len(text), 1.0] for text in texts])
+
+
+@pytest.fixture
+def fake_model(monkeypatch):
+    """Serve a recording fake as the loaded embedding model."""
+    model = FakeEmbeddingModel()
+    monkeypatch.setitem(rag_tools._embedding_models, rag_tools.LOCAL_EMBEDDING_MODEL, model)
+    rag_tools._embedding_cache.clear()
+    yield model
+    rag_tools._embedding_cache.clear()
+
+
+class TestLocalSimilarity:
+    """Test embedding-based similarity scoring."""
+
+    def test_model_is_loaded_once(self, fake_model):
+        """Test that repeated loads return the same model instance."""
+        assert rag_tools.load_embedding_model() is fake_model
+        assert rag_tools.load_embedding_model() is fake_model
+
+    def test_embeddings_are_memoized(self, fake_model):
+        """Test that texts already embedded are not encoded again."""
+        tools = RAGTools(judge_tools=object())
+
+        first = tools._local_similarity("query", ["doc a", "doc bb"])
+        second = tools._local_similarity("query", ["doc bb", "doc ccc"])
+
+        assert fake_model.encoded == [["query", "doc a", "doc bb"], ["doc ccc"]]
+        assert first[1] == second[0]
+
+    def test_embeddings_are_cached_per_model(self, fake_model):
+        """Test that one model's embeddings are never served for another model."""
+        tools = RAGTools(judge_tools=object())
+        other_model = FakeEmbeddingModel()
+
+        tools._embed(rag_tools.LOCAL_EMBEDDING_MODEL, fake_model, ["doc a"])
+        tools._embed("other-model", other_model, ["doc a"])
+
+        assert other_model.encoded == [["doc a"]]
+
+    def test_cache_keys_do_not_hold_texts(self, fake_model):
+        """Test that cached embeddings are keyed on a fixed-size digest of the text."""
+        tools = RAGTools(judge_tools=object())
+
+        tools._embed(rag_tools.LOCAL_EMBEDDING_MODEL, fake_model, ["a long retrieved document " * 100])
+
+        assert [len(digest) for _, digest in rag_tools._embedding_cache.keys()] == [16]